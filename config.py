@@ -10,34 +10,55 @@ All paths can be overridden via CLI flags or direct imports.
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
 
 
 # Supported file extensions for images
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".avif"}
+IMAGE_EXTENSIONS = frozenset(
+    {".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tiff", ".avif"}
+)
+# Same extensions as a tuple, for fast ``str.endswith`` checks on raw filenames
+IMAGE_EXTENSIONS_TUPLE = tuple(sorted(IMAGE_EXTENSIONS))
 
 
 # Canonical target resolutions by aspect ratio (width, height). Values are multiples of 64
-# and align with common Stable Diffusion LoRA training presets.
-ACCEPTED_SHAPES: Dict[str, Tuple[int, int]] = {
-    "1:1": (1024, 1024),
-    # Portraits
-    "3:4": (896, 1152),
-    "5:8": (832, 1216),
-    "9:16": (768, 1344),
-    "9:21": (640, 1536),
-    # Landscapes (reverse orientations)
-    "4:3": (1152, 896),
-    "8:5": (1216, 832),
-    "16:9": (1344, 768),
-    "21:9": (1536, 640),
-}
+# and align with common Stable Diffusion LoRA training presets. Read-only so the
+# shared mapping cannot be mutated at runtime.
+ACCEPTED_SHAPES: Mapping[str, Tuple[int, int]] = MappingProxyType(
+    {
+        "1:1": (1024, 1024),
+        # Portraits
+        "3:4": (896, 1152),
+        "5:8": (832, 1216),
+        "9:16": (768, 1344),
+        "9:21": (640, 1536),
+        # Landscapes (reverse orientations)
+        "4:3": (1152, 896),
+        "8:5": (1216, 832),
+        "16:9": (1344, 768),
+        "21:9": (1536, 640),
+    }
+)
 
 
 RESAMPLE_METHOD = "lanczos"  # one of {nearest, bilinear, bicubic, lanczos}
 
+# Batch resize backend: "auto" uses libvips (pyvips) when installed for
+# decode-time shrinking, "pil" forces Pillow (or a Pillow-SIMD drop-in).
+RESIZE_BACKEND = "auto"  # one of {auto, vips, pil}
+
+# Shared caption cache. Entries are keyed by image content and captioning
+# settings, so one location serves every input and output directory.
+CAPTION_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "image-lora-prep"
+    / "captions"
+)
+
 
 @dataclass
 class Paths:
@@ -98,6 +119,13 @@ class Behavior:
     resample
         Resampling method for resizing operations. One of: 'nearest', 'bilinear',
         'bicubic', 'lanczos'.
+    workers
+        Number of worker processes for batch image processing. If None, uses
+        the number of CPUs.
+    postprocess
+        Optional external optimizers run on every written image, keyed by
+        extension without the dot, e.g. ``{"png": "oxipng -o 4 {path}",
+        "jpg": "jpegoptim --strip-none {path}"}``. Missing tools are skipped.
     """
 
     overwrite: bool = False
@@ -105,6 +133,8 @@ class Behavior:
     keep_metadata: bool = True
     use_letterbox: bool = False
     resample: str = RESAMPLE_METHOD
+    workers: int | None = None
+    postprocess: Dict[str, str] | None = None
 
 
 @dataclass
@@ -121,13 +151,16 @@ class ProjectConfig:
         Execution-time toggles.
     accepted_shapes
         Mapping from aspect ratio label to target resolution (width, height).
+        Defaults to the shared read-only ``ACCEPTED_SHAPES``.
     """
 
     paths: Paths = field(default_factory=Paths)
     constraints: Constraints = field(default_factory=Constraints)
     behavior: Behavior = field(default_factory=Behavior)
-    accepted_shapes: Dict[str, Tuple[int, int]] = field(
-        default_factory=lambda: dict(ACCEPTED_SHAPES)
+    # A factory is still required because dataclasses reject unhashable
+    # defaults, but it returns the shared proxy instead of copying it.
+    accepted_shapes: Mapping[str, Tuple[int, int]] = field(
+        default_factory=lambda: ACCEPTED_SHAPES
     )
 
 
@@ -141,14 +174,34 @@ class Captioning:
         Vision-capable chat model for captioning.
     max_tokens
         Maximum tokens for the caption response.
+    workers
+        Number of concurrent captioning requests.
+    images_per_request
+        Number of images captioned per API request. Values above 1 send the
+        images together and ask for a JSON array of captions, trading some
+        output reliability for fewer round trips.
+    upload_images
+        If True, upload images through the OpenAI Files API and reference them
+        by file id instead of embedding them as base64 data URLs. Sends ~25%
+        fewer bytes per image at the cost of an extra upload request.
+    cache_dir
+        Directory of the content-hash caption cache, shared across runs and
+        output directories. Defaults to ``CAPTION_CACHE_DIR``.
     system_prompt
         A system role message to guide the model behavior.
     user_prompt
         Default user instruction prepended to the image in the prompt.
+    group_prompt
+        Instruction appended to the user prompt when several images share one
+        request. ``{count}`` is replaced with the number of images.
     """
 
     model: str = "gpt-5"
     max_tokens: int = 1024
+    workers: int = 8
+    images_per_request: int = 1
+    upload_images: bool = False
+    cache_dir: Path = CAPTION_CACHE_DIR
     system_prompt: str = (
         "You are an expert image captioner for training datasets. "
         "Write a detailed, natural-language description of the visible content "
@@ -164,6 +217,12 @@ class Captioning:
         "the trigger phrase: 'vampire fangs' naturally into the caption. Do not output "
         "newlines or tabs."
     )
+    group_prompt: str = (
+        "There are {count} images attached. Caption each one separately "
+        "following the instructions above. Respond with only a JSON array of "
+        "{count} strings, one caption per image, in the order the images were "
+        "given."
+    )
 
 
 # Default singleton-style config instance used by CLI unless overridden
@@ -14,20 +14,19 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from config import CONFIG
+from config import CAPTION, CONFIG
 from src.func.io_utils import (
     iter_image_paths,
     load_image_with_exif,
     save_image,
 )
 from src.func.resize import (
-    center_crop_to_aspect,
-    resize_to_exact,
+    center_crop_box,
+    crop_and_resize,
     resize_within_bounds,
     letterbox_to_aspect,
 )
 from src.func.crop_auto import process_auto_crop_batch
-from src.func.crop_manual_gui import run_manual_cropper
 from src.func.caption import caption_batch
 from src.func.rename import rename_images
 
@@ -109,21 +108,28 @@ def cmd_scale(
     cfg.constraints.max_height = max_height
     cfg.constraints.allow_upscale = allow_upscale
 
+    aspect = target_w / target_h
     for src in iter_image_paths(input_path):
         dest = output_dir / src.name
         if dest.exists() and not overwrite:
             continue
         img, exif = load_image_with_exif(src)
+        # Returns the image untouched when it already satisfies the constraints
         img = resize_within_bounds(img, cfg.constraints, resample=resample)
         if letterbox:
             # Letterbox to exact shape
             result = letterbox_to_aspect(img, (target_w, target_h), resample=resample)
         else:
-            # Center crop then resize
-            aspect = target_w / target_h
-            cropped = center_crop_to_aspect(img, aspect)
-            result = resize_to_exact(cropped, (target_w, target_h), resample=resample)
-        save_image(result, dest, keep_metadata=keep_metadata, original_exif=exif)
+            # Center crop and resize in a single resample pass
+            box = center_crop_box(img.size, aspect)
+            result = crop_and_resize(img, box, (target_w, target_h), resample=resample)
+        save_image(
+            result,
+            dest,
+            keep_metadata=keep_metadata,
+            original_exif=exif,
+            postprocess=cfg.behavior.postprocess,
+        )
 
 
 @cli.command(name="crop-auto")
@@ -141,6 +147,12 @@ def cmd_scale(
     ),
     default=CONFIG.behavior.resample,
 )
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=CONFIG.behavior.workers,
+    help="Number of worker processes (defaults to CPU count)",
+)
 def cmd_crop_auto(
     input_path: Path,
     output_dir: Path,
@@ -148,6 +160,7 @@ def cmd_crop_auto(
     overwrite: bool,
     keep_metadata: bool,
     resample: str,
+    workers: Optional[int],
 ) -> None:
     """Automated center-cropping to the specified shape."""
 
@@ -158,6 +171,7 @@ def cmd_crop_auto(
         overwrite=overwrite,
         keep_metadata=keep_metadata,
         resample=resample,
+        workers=workers,
     )
 
 
@@ -176,6 +190,9 @@ def cmd_crop_manual(
     """Launch the manual cropping GUI."""
 
     _ = _resolve_shape(shape)
+    # Imported here so the other commands never load tkinter or PIL.ImageTk
+    from src.func.crop_manual_gui import run_manual_cropper
+
     run_manual_cropper(
         input_dir=input_dir,
         output_dir=output_dir,
@@ -199,6 +216,34 @@ def cmd_crop_manual(
     help="OpenAI API key (defaults to env var)",
 )
 @click.option("--overwrite/--no-overwrite", default=True)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=CAPTION.workers,
+    help="Number of concurrent API requests",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    help="Reuse captions for identical images and settings",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(path_type=Path, file_okay=False),
+    default=None,
+    help=f"Caption cache location (default: {CAPTION.cache_dir})",
+)
+@click.option(
+    "--upload/--no-upload",
+    default=CAPTION.upload_images,
+    help="Send images via the Files API instead of inline base64",
+)
+@click.option(
+    "--images-per-request",
+    type=click.IntRange(min=1),
+    default=CAPTION.images_per_request,
+    help="Caption several images per API request",
+)
 def cmd_caption(
     input_path: Path,
     output_dir: Path,
@@ -207,18 +252,32 @@ def cmd_caption(
     max_tokens: Optional[int],
     api_key: Optional[str],
     overwrite: bool,
+    workers: int,
+    cache: bool,
+    cache_dir: Optional[Path],
+    upload: bool,
+    images_per_request: int,
 ) -> None:
     """Caption images with OpenAI and write .txt files using image stems."""
 
-    caption_batch(
-        input_path=input_path,
-        output_dir=output_dir,
-        user_prompt=prompt,
-        model=model,
-        max_tokens=max_tokens,
-        api_key=api_key,
-        overwrite=overwrite,
-    )
+    try:
+        caption_batch(
+            input_path=input_path,
+            output_dir=output_dir,
+            user_prompt=prompt,
+            model=model,
+            max_tokens=max_tokens,
+            api_key=api_key,
+            overwrite=overwrite,
+            workers=workers,
+            use_cache=cache,
+            cache_dir=cache_dir,
+            upload=upload,
+            images_per_request=images_per_request,
+        )
+    except RuntimeError as exc:
+        # Per-image failures were logged; exit non-zero for scripts and CI
+        raise click.ClickException(str(exc)) from exc
 
 
 @cli.command(name="rename")
@@ -2,29 +2,74 @@
 
 This module provides functions to caption images using a vision-capable model
 via the Responses API. Captions are written alongside images using the same
-filename stem with a ``.txt`` extension.
+filename stem with a ``.txt`` extension. Images are sent inline as base64 data
+URLs, or optionally uploaded through the Files API and referenced by id.
 """
 
 from __future__ import annotations
 
 import base64
+import hashlib
+import json
+import logging
 import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from openai import OpenAI
 
 from config import CAPTION
-from .io_utils import iter_image_paths
+from .io_utils import existing_names, iter_image_paths
 
 
-def _encode_image_to_data_url(path: Path) -> str:
+logger = logging.getLogger(__name__)
+
+# MIME types for data URLs, keyed by lowercase file suffix
+_MIME_BY_SUFFIX: Mapping[str, str] = MappingProxyType(
+    {
+        ".jpg": "image/jpeg",
+        ".jpeg": "image/jpeg",
+        ".png": "image/png",
+        ".webp": "image/webp",
+        ".bmp": "image/bmp",
+        ".tiff": "image/tiff",
+    }
+)
+
+# Read size for base64 encoding; must be divisible by 3.
+_ENCODE_CHUNK_SIZE = 57 * 1024
+
+# Queued caption write: (destination, file text, optional cache entry path)
+_Write = Tuple[Path, str, Optional[Path]]
+
+
+def _encode_image_to_data_url(path: Path, hasher: Optional[Any] = None) -> str:
     """Encode an image file to a data URL (base64) for API submission.
 
     Parameters
     ----------
     path
         Image path.
+    hasher
+        Optional ``hashlib`` object updated with the raw file bytes while
+        encoding, so content hashing needs no extra read.
 
     Returns
     -------
@@ -32,17 +77,59 @@ def _encode_image_to_data_url(path: Path) -> str:
         Data URL suitable for OpenAI vision message content.
     """
 
-    mime = {
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".png": "image/png",
-        ".webp": "image/webp",
-        ".bmp": "image/bmp",
-        ".tiff": "image/tiff",
-    }.get(path.suffix.lower(), "application/octet-stream")
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("ascii")
-    return f"data:{mime};base64,{b64}"
+    mime = _MIME_BY_SUFFIX.get(path.suffix.lower(), "application/octet-stream")
+    # Encode in chunks whose size is a multiple of 3 so no padding is emitted
+    # mid-stream; this avoids holding the raw file, its base64 copy, and the
+    # final string in memory at the same time.
+    buf = bytearray(f"data:{mime};base64,".encode("ascii"))
+    with open(path, "rb", buffering=_ENCODE_CHUNK_SIZE) as f:
+        while chunk := f.read(_ENCODE_CHUNK_SIZE):
+            if hasher is not None:
+                hasher.update(chunk)
+            buf += base64.b64encode(chunk)
+    return buf.decode("ascii")
+
+
+def _resolve_api_key(api_key: Optional[str] = None) -> str:
+    """Return an explicit API key or fall back to the environment.
+
+    Parameters
+    ----------
+    api_key
+        OpenAI API key. If None, reads from the OPENAI_API_KEY
+        environment variable.
+
+    Returns
+    -------
+    str
+        Resolved API key.
+    """
+
+    key = api_key or os.environ.get("OPENAI_API_KEY")
+    if not key:
+        raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
+    return key
+
+
+@lru_cache(maxsize=None)
+def _get_client(api_key: str) -> OpenAI:
+    """Return a shared OpenAI client for ``api_key``.
+
+    The client owns an HTTP connection pool, so caching it lets repeated
+    calls reuse open TLS connections instead of reconnecting per image.
+
+    Parameters
+    ----------
+    api_key
+        OpenAI API key.
+
+    Returns
+    -------
+    OpenAI
+        Cached client instance.
+    """
+
+    return OpenAI(api_key=api_key)
 
 
 def caption_image(
@@ -51,6 +138,8 @@ def caption_image(
     model: Optional[str] = None,
     max_tokens: Optional[int] = None,
     api_key: Optional[str] = None,
+    client: Optional[OpenAI] = None,
+    upload: Optional[bool] = None,
 ) -> str:
     """Generate a caption for a single image.
 
@@ -67,7 +156,12 @@ def caption_image(
         Token limit override. If None, uses config default.
     api_key
         OpenAI API key. If None, reads from the OPENAI_API_KEY
-        environment variable.
+        environment variable. Ignored when ``client`` is given.
+    client
+        Optional pre-built OpenAI client to reuse across calls.
+    upload
+        If True, upload the image through the Files API instead of sending
+        it inline as base64. If None, uses config default.
 
     Returns
     -------
@@ -75,29 +169,71 @@ def caption_image(
         Caption string.
     """
 
-    key = api_key or os.environ.get("OPENAI_API_KEY")
-    if not key:
-        raise RuntimeError("OPENAI_API_KEY environment variable is not set.")
-
-    client = OpenAI(api_key=key)
+    if client is None:
+        client = _get_client(_resolve_api_key(api_key))
 
+    if CAPTION.upload_images if upload is None else upload:
+        with _uploaded_images(client, [image_path]) as parts:
+            return _request_caption(client, parts[0], user_prompt, model, max_tokens)
     data_url = _encode_image_to_data_url(image_path)
+    return _request_caption(
+        client, _inline_image_part(data_url), user_prompt, model, max_tokens
+    )
+
+
+def _inline_image_part(data_url: str) -> Dict[str, str]:
+    """Build a Responses API image content part from a data URL."""
+
+    return {"type": "input_image", "image_url": data_url}
+
+
+def _upload_image(client: OpenAI, path: Path) -> str:
+    """Upload an image through the Files API and return its file id.
+
+    The raw bytes are sent as multipart form data, avoiding the ~33% size
+    overhead and encoding cost of an inline base64 data URL.
+    """
+
+    with open(path, "rb") as f:
+        return client.files.create(file=f, purpose="vision").id
+
+
+@contextmanager
+def _uploaded_images(
+    client: OpenAI, paths: Sequence[Path]
+) -> Iterator[List[Dict[str, str]]]:
+    """Upload images for the duration of a block and yield their content parts.
+
+    The uploaded files are deleted on exit so batches do not accumulate
+    storage on the account.
+    """
+
+    file_ids: List[str] = []
+    try:
+        for path in paths:
+            file_ids.append(_upload_image(client, path))
+        yield [{"type": "input_image", "file_id": file_id} for file_id in file_ids]
+    finally:
+        for file_id in file_ids:
+            try:
+                client.files.delete(file_id)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Failed to delete uploaded file %s: %s", file_id, exc)
+
+
+def _request_text(
+    client: OpenAI,
+    content: List[Dict[str, str]],
+    model: Optional[str],
+    max_tokens: int,
+) -> str:
+    """Send one user message to the Responses API and return its output text."""
+
     response = client.responses.create(
         model=model or CAPTION.model,
-        input=[
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": user_prompt or CAPTION.user_prompt,
-                    },
-                    {"type": "input_image", "image_url": data_url},
-                ],
-            }
-        ],
+        input=[{"role": "user", "content": content}],
         instructions=CAPTION.system_prompt,
-        max_output_tokens=int(max_tokens or CAPTION.max_tokens),
+        max_output_tokens=max_tokens,
         # temperature=0.2,
     )
 
@@ -126,6 +262,192 @@ def caption_image(
     raise RuntimeError(f"Unexpected API response shape: {data}")
 
 
+def _request_caption(
+    client: OpenAI,
+    image_part: Dict[str, str],
+    user_prompt: Optional[str],
+    model: Optional[str],
+    max_tokens: Optional[int],
+) -> str:
+    """Send one image content part to the Responses API and return its caption."""
+
+    content = [
+        {"type": "input_text", "text": user_prompt or CAPTION.user_prompt},
+        image_part,
+    ]
+    return _request_text(client, content, model, int(max_tokens or CAPTION.max_tokens))
+
+
+def _parse_caption_list(text: str, count: int) -> Optional[List[str]]:
+    """Extract a JSON array of exactly ``count`` captions from model output.
+
+    Returns None if the output is not such an array, e.g. because the model
+    added prose or wrapped only part of the answer in a code fence.
+    """
+
+    start, end = text.find("["), text.rfind("]")
+    if start < 0 or end < start:
+        return None
+    try:
+        captions = json.loads(text[start : end + 1])
+    except ValueError:
+        return None
+    if (
+        not isinstance(captions, list)
+        or len(captions) != count
+        or not all(isinstance(c, str) and c.strip() for c in captions)
+    ):
+        return None
+    return [c.strip() for c in captions]
+
+
+def _request_captions(
+    client: OpenAI,
+    image_parts: List[Dict[str, str]],
+    user_prompt: Optional[str],
+    model: Optional[str],
+    max_tokens: Optional[int],
+) -> List[str]:
+    """Caption several images, sharing one request when there is more than one.
+
+    The model is asked for a JSON array with one caption per image. If the
+    reply cannot be parsed, each image is captioned with its own request.
+    """
+
+    if len(image_parts) == 1:
+        return [
+            _request_caption(client, image_parts[0], user_prompt, model, max_tokens)
+        ]
+
+    count = len(image_parts)
+    instruction = (user_prompt or CAPTION.user_prompt) + "\n\n"
+    instruction += CAPTION.group_prompt.format(count=count)
+    per_image = int(max_tokens or CAPTION.max_tokens)
+    text = _request_text(
+        client,
+        [{"type": "input_text", "text": instruction}, *image_parts],
+        model,
+        per_image * count,
+    )
+    captions = _parse_caption_list(text, count)
+    if captions is not None:
+        return captions
+    logger.warning(
+        "Could not parse %d captions from grouped response; retrying one by one.",
+        count,
+    )
+    return [
+        _request_caption(client, part, user_prompt, model, max_tokens)
+        for part in image_parts
+    ]
+
+
+def _cache_hasher(
+    user_prompt: Optional[str], model: Optional[str], max_tokens: Optional[int]
+) -> Any:
+    """Return a BLAKE2b hasher seeded with every input that shapes a caption.
+
+    Feeding the image bytes into the returned object yields a key that only
+    matches when both the image content and the request settings match.
+    """
+
+    hasher = hashlib.blake2b(digest_size=16)
+    settings = (
+        model or CAPTION.model,
+        str(int(max_tokens or CAPTION.max_tokens)),
+        CAPTION.system_prompt,
+        user_prompt or CAPTION.user_prompt,
+    )
+    hasher.update("\0".join(settings).encode("utf-8") + b"\0")
+    return hasher
+
+
+def _hash_file(path: Path, hasher: Any) -> None:
+    """Feed the raw bytes of ``path`` into ``hasher`` in chunks."""
+
+    with open(path, "rb", buffering=_ENCODE_CHUNK_SIZE) as f:
+        while chunk := f.read(_ENCODE_CHUNK_SIZE):
+            hasher.update(chunk)
+
+
+def _write_caption(dest: Path, text: str, cached: Optional[Path] = None) -> None:
+    """Write a caption file and, if given, its content-hash cache entry."""
+
+    dest.write_text(text, encoding="utf-8")
+    if cached is not None:
+        # Write then rename so an interrupted run never leaves a partial entry
+        fd, tmp = tempfile.mkstemp(dir=cached.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, cached)
+
+
+def _writer_loop(writes: queue.Queue[Optional[_Write]], failed: List[Path]) -> None:
+    """Drain queued caption writes until a ``None`` sentinel arrives.
+
+    Paths whose write raised are appended to ``failed``.
+    """
+
+    while (item := writes.get()) is not None:
+        dest, text, cached = item
+        try:
+            _write_caption(dest, text, cached)
+        except Exception as exc:  # noqa: BLE001
+            failed.append(dest)
+            logger.error("Failed to write %s: %s", dest, exc)
+
+
+def _caption_to_files(
+    group: Sequence[Tuple[Path, Path]],
+    client: OpenAI,
+    user_prompt: Optional[str],
+    model: Optional[str],
+    max_tokens: Optional[int],
+    cache_dir: Optional[Path] = None,
+    upload: bool = False,
+    write: Callable[[Path, str, Optional[Path]], None] = _write_caption,
+) -> None:
+    """Caption a group of images and write each result to its destination.
+
+    When ``cache_dir`` is given, a caption previously generated for identical
+    image content and settings is reused instead of calling the API. Images
+    still needing a caption are sent together in one request. Output is handed
+    to ``write`` as ``(dest, text, cache_entry)``, which writes synchronously
+    by default.
+    """
+
+    todo: List[Tuple[Path, Path, Optional[str], Optional[Path]]] = []
+    for img_path, dest in group:
+        data_url: Optional[str] = None
+        cached: Optional[Path] = None
+        if cache_dir is not None:
+            hasher = _cache_hasher(user_prompt, model, max_tokens)
+            if upload:
+                _hash_file(img_path, hasher)
+            else:
+                # Hash during encoding so the file is read only once
+                data_url = _encode_image_to_data_url(img_path, hasher=hasher)
+            cached = cache_dir / f"{hasher.hexdigest()}.txt"
+            if cached.is_file():
+                write(dest, cached.read_text(encoding="utf-8"), None)
+                continue
+        todo.append((img_path, dest, data_url, cached))
+    if not todo:
+        return
+
+    if upload:
+        with _uploaded_images(client, [item[0] for item in todo]) as parts:
+            captions = _request_captions(client, parts, user_prompt, model, max_tokens)
+    else:
+        parts = [
+            _inline_image_part(data_url or _encode_image_to_data_url(img_path))
+            for img_path, _, data_url, _ in todo
+        ]
+        captions = _request_captions(client, parts, user_prompt, model, max_tokens)
+    for (_, dest, _, cached), caption in zip(todo, captions):
+        write(dest, caption + "\n", cached)
+
+
 def caption_batch(
     input_path: Path,
     output_dir: Path,
@@ -134,9 +456,23 @@ def caption_batch(
     max_tokens: Optional[int] = None,
     api_key: Optional[str] = None,
     overwrite: bool = True,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    upload: Optional[bool] = None,
+    images_per_request: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
 ) -> None:
     """Caption all images under a path and write .txt files next to outputs.
 
+    Requests are issued concurrently from a thread pool sharing one client,
+    while a single background thread writes the resulting files so API slots
+    are not held up by disk I/O. A failure on one request is logged and does
+    not abort the rest of the batch; once all images have been attempted a
+    ``RuntimeError`` reports how many failed. Captions are also stored in a shared
+    cache directory keyed by a hash of the image bytes and captioning
+    settings, so duplicate images and re-runs with the same settings, into
+    any output directory, do not repeat API calls.
+
     Parameters
     ----------
     input_path
@@ -147,20 +483,87 @@ def caption_batch(
         Optional overrides for captioning configuration.
     overwrite
         Whether to overwrite existing caption files.
+    workers
+        Number of concurrent API requests. If None, uses config default.
+    use_cache
+        Whether to reuse and record captions in the content-hash cache.
+    upload
+        Whether to send images through the Files API instead of inline
+        base64. If None, uses config default.
+    images_per_request
+        Number of images captioned per API request. Values above 1 amortize
+        request latency; if a grouped reply cannot be parsed its images are
+        retried one by one. If None, uses config default.
+    cache_dir
+        Location of the caption cache. If None, uses config default.
     """
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    existing = set() if overwrite else existing_names(output_dir)
+    pending: List[Tuple[Path, Path]] = []
     for img_path in iter_image_paths(Path(input_path)):
-        dest = output_dir / (img_path.stem + ".txt")
-        if dest.exists() and not overwrite:
+        name = img_path.stem + ".txt"
+        if name in existing:
             continue
-        caption = caption_image(
-            img_path,
-            user_prompt=user_prompt,
-            model=model,
-            max_tokens=max_tokens,
-            api_key=api_key,
-        )
-        dest.write_text(caption + "\n", encoding="utf-8")
+        # Sources sharing a stem (subfolders, a.jpg and a.png) map to one
+        # caption file; only the first is captioned
+        existing.add(name)
+        pending.append((img_path, output_dir / name))
+    if not pending:
+        # Nothing to caption: return before resolving the API key or
+        # building a client, so re-runs over a finished directory are free.
+        logger.info("All captions in %s are up to date.", output_dir)
+        return
+
+    if use_cache:
+        cache_dir = Path(cache_dir or CAPTION.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    else:
+        cache_dir = None
+
+    group_size = max(1, images_per_request or CAPTION.images_per_request)
+    groups = [pending[i : i + group_size] for i in range(0, len(pending), group_size)]
+    client = _get_client(_resolve_api_key(api_key))
+    failures = 0
+    writes: queue.Queue[Optional[_Write]] = queue.Queue()
+    failed_writes: List[Path] = []
+    writer = threading.Thread(
+        target=_writer_loop, args=(writes, failed_writes), daemon=True
+    )
+    writer.start()
+
+    def enqueue_write(dest: Path, text: str, cached: Optional[Path]) -> None:
+        writes.put((dest, text, cached))
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers or CAPTION.workers)) as pool:
+            futures = {
+                pool.submit(
+                    _caption_to_files,
+                    group,
+                    client,
+                    user_prompt,
+                    model,
+                    max_tokens,
+                    cache_dir,
+                    CAPTION.upload_images if upload is None else upload,
+                    enqueue_write,
+                ): group
+                for group in groups
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exc:  # noqa: BLE001
+                    group = futures[future]
+                    failures += len(group)
+                    names = ", ".join(str(img_path) for img_path, _ in group)
+                    logger.error("Failed to caption %s: %s", names, exc)
+    finally:
+        writes.put(None)
+        writer.join()
+    failures += len(failed_writes)
+    if failures:
+        raise RuntimeError(f"{failures} of {len(pending)} images failed to caption.")
@@ -6,31 +6,48 @@ resizes to the canonical resolution for that aspect.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from PIL import Image
 
 from config import CONFIG
-from .io_utils import iter_image_paths, load_image_with_exif, save_image
-from .resize import center_crop_to_aspect, resize_to_exact
+from .io_utils import (
+    existing_names,
+    iter_image_paths,
+    load_image_with_exif,
+    map_resample,
+    read_exif_only,
+    save_image,
+)
+from .resize import REDUCING_GAP, center_crop_box, vips_crop_to_size
 
 
 def auto_crop_image_to_shape(
     image: Image.Image,
     target_size: Tuple[int, int],
-    resample: str,
+    target_aspect: float,
+    resample_filter: int,
 ) -> Image.Image:
     """Center-crop to target aspect then resize to exact target size.
 
+    The crop and resample are fused into a single ``Image.resize`` call with a
+    source box, so no intermediate cropped image is materialized. Batch-wide
+    invariants are passed in precomputed so nothing is re-derived per image.
+
     Parameters
     ----------
     image
         Source image.
     target_size
         Target (width, height) for the output.
-    resample
-        Resampling method name.
+    target_aspect
+        ``target_size`` width / height.
+    resample_filter
+        Pillow resampling constant, e.g. from ``map_resample``.
 
     Returns
     -------
@@ -38,9 +55,73 @@ def auto_crop_image_to_shape(
         Cropped and resized image.
     """
 
-    target_aspect = target_size[0] / target_size[1]
-    cropped = center_crop_to_aspect(image, target_aspect)
-    return resize_to_exact(cropped, target_size, resample=resample)
+    box = center_crop_box(image.size, target_aspect)
+    return image.resize(
+        target_size, resample_filter, box=box, reducing_gap=REDUCING_GAP
+    )
+
+
+def make_crop_kernel(
+    target_size: Tuple[int, int], resample: str = "lanczos"
+) -> Callable[[Image.Image], Image.Image]:
+    """Specialize ``auto_crop_image_to_shape`` for one target size.
+
+    The target size, its aspect ratio, and the Pillow filter are bound once,
+    so applying the kernel to each image is a single call with no per-image
+    lookups. The kernel is a ``functools.partial`` of a module-level function
+    and can therefore be pickled for worker processes.
+
+    Parameters
+    ----------
+    target_size
+        Target (width, height) for the output.
+    resample
+        Resampling method name.
+
+    Returns
+    -------
+    callable
+        Function mapping a source image to its cropped and resized output.
+    """
+
+    return partial(
+        auto_crop_image_to_shape,
+        target_size=target_size,
+        target_aspect=target_size[0] / target_size[1],
+        resample_filter=map_resample(resample),
+    )
+
+
+def _process_one(
+    src: Path,
+    dest: Path,
+    kernel: Callable[[Image.Image], Image.Image],
+    keep_metadata: bool,
+    draft_size: Optional[Tuple[int, int]] = None,
+    load_cropped: Optional[Callable[[Path], Optional[Image.Image]]] = None,
+    postprocess: Optional[Dict[str, str]] = None,
+) -> None:
+    """Load, auto-crop, and save a single image.
+
+    ``load_cropped`` may produce the final image straight from the file (e.g.
+    via libvips); when it returns None the image is decoded with Pillow and
+    passed through ``kernel``. Defined at module level so it can be pickled
+    for worker processes.
+    """
+
+    result = load_cropped(src) if load_cropped is not None else None
+    if result is None:
+        image, exif = load_image_with_exif(src, target_size=draft_size)
+        result = kernel(image)
+    else:
+        exif = read_exif_only(src)
+    save_image(
+        result,
+        dest,
+        keep_metadata=keep_metadata,
+        original_exif=exif,
+        postprocess=postprocess,
+    )
 
 
 def process_auto_crop_batch(
@@ -50,9 +131,12 @@ def process_auto_crop_batch(
     overwrite: bool = False,
     keep_metadata: bool = True,
     resample: str = "lanczos",
+    workers: Optional[int] = None,
 ) -> None:
     """Process a batch of images using automated center-crop strategy.
 
+    Images are independent, so they are distributed across a process pool.
+
     Parameters
     ----------
     input_path
@@ -67,6 +151,10 @@ def process_auto_crop_batch(
         Preserve EXIF metadata when possible.
     resample
         Resampling method name.
+    workers
+        Number of worker processes. If None, uses ``CONFIG.behavior.workers``,
+        falling back to the CPU count. A value of 1 processes images in the
+        calling process.
     """
 
     if shape_label not in CONFIG.accepted_shapes:
@@ -76,11 +164,42 @@ def process_auto_crop_batch(
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
+    existing = set() if overwrite else existing_names(out_dir)
+    sources: List[Path] = []
+    dests: List[Path] = []
     for src in iter_image_paths(Path(input_path)):
         rel = src.name
-        dest = out_dir / rel
-        if dest.exists() and not overwrite:
+        if rel in existing:
             continue
-        image, exif = load_image_with_exif(src)
-        result = auto_crop_image_to_shape(image, target_size, resample=resample)
-        save_image(result, dest, keep_metadata=keep_metadata, original_exif=exif)
+        # Same-named sources in different subfolders share one output path;
+        # queue only the first so workers never write the same file
+        existing.add(rel)
+        dest = out_dir / rel
+        sources.append(src)
+        dests.append(dest)
+    if not sources:
+        return
+
+    process = partial(
+        _process_one,
+        kernel=make_crop_kernel(target_size, resample),
+        keep_metadata=keep_metadata,
+        # Let JPEGs decode at reduced scale, keeping 2x headroom over the
+        # output so the final Lanczos pass still has detail to work with.
+        draft_size=(target_size[0] * 2, target_size[1] * 2),
+        load_cropped=partial(
+            vips_crop_to_size, target_size=target_size, resample=resample
+        ),
+        # Bound here so spawned workers see the caller's settings
+        postprocess=CONFIG.behavior.postprocess,
+    )
+    n_workers = workers or CONFIG.behavior.workers or os.cpu_count() or 1
+    n_workers = min(n_workers, len(sources))
+    if n_workers <= 1:
+        for src, dest in zip(sources, dests):
+            process(src, dest)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        # Consume results so worker exceptions propagate to the caller
+        for _ in pool.map(process, sources, dests):
+            pass
@@ -9,6 +9,8 @@ defined in ``config.ACCEPTED_SHAPES``.
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -19,7 +21,29 @@ from PIL import Image, ImageTk
 
 from config import CONFIG
 from .io_utils import iter_image_paths, load_image_with_exif, save_image
-from .resize import resize_to_exact
+from .resize import REDUCING_GAP
+
+
+# Number of upcoming images decoded in the background while the user crops
+PREFETCH_AHEAD = 2
+
+# Number of recently shown images whose previews are kept so Back does not
+# reload them
+HISTORY_SIZE = 4
+
+# ``Image.resize`` reducing gap for the fit-to-canvas preview
+DISPLAY_REDUCING_GAP = 2.0
+
+
+def _normalize_mode(image: Image.Image) -> Image.Image:
+    """Convert palette and other exotic modes so Lanczos resizing applies."""
+
+    if image.mode == "P":
+        # Palette images would otherwise be resized with NEAREST
+        return image.convert("RGBA" if "transparency" in image.info else "RGB")
+    if image.mode not in ("RGB", "RGBA", "L", "LA"):
+        return image.convert("RGB")
+    return image
 
 
 @dataclass
@@ -27,12 +51,15 @@ class CropState:
     """State of the current cropping session."""
 
     image_path: Path
-    pil_image: Image.Image
     exif_bytes: Optional[bytes]
     display_image: Image.Image
-    display_scale: float
-    rect: Tuple[int, int, int, int]  # x0, y0, x1, y1 in display coords
+    # Crop rect in display coords, kept as scalars so drags update it in place
+    rx0: int
+    ry0: int
+    rx1: int
+    ry1: int
     shape_label: str
+    tk_image: Optional[ImageTk.PhotoImage] = None  # built lazily on the Tk thread
 
 
 class ManualCropperApp:
@@ -118,29 +145,48 @@ class ManualCropperApp:
 
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_down)
         self.canvas.bind("<B1-Motion>", self.on_mouse_drag)
+        self.canvas.bind("<Configure>", self._layout)
 
         self.drag_offset: Optional[Tuple[int, int]] = None
+        self.image_item: Optional[int] = None
+        self.overlay_item: Optional[int] = None
         self.rect_item: Optional[int] = None
-        self.tk_image: Optional[ImageTk.PhotoImage] = None
+        self.image_origin: Tuple[int, int] = (0, 0)
+
+        # Background decoding of upcoming images: index -> (canvas size, future)
+        self._prefetcher = ThreadPoolExecutor(max_workers=1)
+        self._prefetched: Dict[int, Tuple[Tuple[int, int], Future[CropState]]] = {}
+        # External optimizers run here so a slow one never blocks the Tk loop
+        self._postprocessor = ThreadPoolExecutor(max_workers=1)
+        # Recently shown states, least recent first: index -> (canvas size, state)
+        self._history: OrderedDict[int, Tuple[Tuple[int, int], CropState]] = (
+            OrderedDict()
+        )
 
         self.load_current()
 
     def run(self) -> None:
         """Start Tk event loop."""
 
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self._prefetcher.shutdown(wait=False, cancel_futures=True)
+            # Let queued optimizer runs finish so saved files end up optimized
+            self._postprocessor.shutdown(wait=True)
 
     # --- Event handlers ---
 
     def on_shape_change(self) -> None:
         self.shape_label = self.shape_var.get()
         self._reset_rect_to_center()
-        self._redraw()
+        self._update_rect()
 
     def on_mouse_down(self, event: tk.Event) -> None:
         if not self.current:
             return
-        x0, y0, x1, y1 = self.current.rect
+        cur = self.current
+        x0, y0, x1, y1 = cur.rx0, cur.ry0, cur.rx1, cur.ry1
         if x0 <= event.x <= x1 and y0 <= event.y <= y1:
             self.drag_offset = (event.x - x0, event.y - y0)
         else:
@@ -148,13 +194,13 @@ class ManualCropperApp:
             self._move_rect_to(
                 event.x - self.drag_offset[0], event.y - self.drag_offset[1]
             )
-            self._redraw()
+            self._update_rect()
 
     def on_mouse_drag(self, event: tk.Event) -> None:
         if not self.current or not self.drag_offset:
             return
         self._move_rect_to(event.x - self.drag_offset[0], event.y - self.drag_offset[1])
-        self._redraw()
+        self._update_rect()
 
     def on_save(self) -> None:
         if not self.current:
@@ -167,18 +213,27 @@ class ManualCropperApp:
             if not messagebox.askyesno("Overwrite?", f"{dest.name} exists. Overwrite?"):
                 self.on_skip()
                 return
-        # Map display rect to original image coords and crop
-        x0, y0, x1, y1 = self.current.rect
-        scale = 1.0 / self.current.display_scale
+        # The preview may come from a draft-decoded reduction, so crop from a
+        # full-resolution decode of the file
+        cur = self.current
+        source, _ = load_image_with_exif(cur.image_path)
+        source = _normalize_mode(source)
+        # Map display rect to source coords. ``resize`` rejects boxes past the
+        # image edge (unlike ``crop``), so clamp rounding overshoot.
+        src_w, src_h = source.size
+        sx = src_w / cur.display_image.width
+        sy = src_h / cur.display_image.height
         crop_box = (
-            int(round(x0 * scale)),
-            int(round(y0 * scale)),
-            int(round(x1 * scale)),
-            int(round(y1 * scale)),
+            max(0, int(round(cur.rx0 * sx))),
+            max(0, int(round(cur.ry0 * sy))),
+            min(src_w, int(round(cur.rx1 * sx))),
+            min(src_h, int(round(cur.ry1 * sy))),
         )
-        cropped = self.current.pil_image.crop(crop_box)
         target_size = CONFIG.accepted_shapes[self.shape_label]
-        result = resize_to_exact(cropped, target_size)
+        # Sample straight from the crop region; no intermediate cropped copy
+        result = source.resize(
+            target_size, Image.LANCZOS, box=crop_box, reducing_gap=REDUCING_GAP
+        )
         fmt = None
         if chosen_ext in {".jpg", ".jpeg"}:
             fmt = "JPEG"
@@ -194,6 +249,8 @@ class ManualCropperApp:
             keep_metadata=True,
             original_exif=self.current.exif_bytes,
             format_override=fmt,
+            postprocess=CONFIG.behavior.postprocess,
+            postprocess_executor=self._postprocessor,
         )
         self.on_next()
 
@@ -217,29 +274,112 @@ class ManualCropperApp:
     # --- Helpers ---
 
     def load_current(self) -> None:
-        path = self.image_paths[self.index]
-        pil, exif = load_image_with_exif(path)
-        self.current = self._build_state(path, pil, exif)
+        canvas_size = self._canvas_size()
+        state = None
+        seen = self._history.pop(self.index, None)
+        if seen is not None and seen[0] == canvas_size:
+            state = seen[1]
+        pending = self._prefetched.pop(self.index, None)
+        if state is not None:
+            if pending is not None:
+                pending[1].cancel()
+        elif pending is not None and pending[0] == canvas_size:
+            try:
+                # Blocks only if the worker is still decoding this image
+                state = pending[1].result()
+            except Exception:  # noqa: BLE001
+                # Reload synchronously below so the error surfaces normally
+                state = None
+        if state is None:
+            state = self._load_state(self.image_paths[self.index], canvas_size)
+        state.shape_label = self.shape_label
+        self.current = state
+        self._history[self.index] = (canvas_size, state)
+        while len(self._history) > HISTORY_SIZE:
+            self._history.popitem(last=False)
         self._reset_rect_to_center()
         self._redraw()
+        # Until the window is mapped the canvas size is only a guess; the
+        # first ``<Configure>`` event schedules the prefetch instead
+        if self.canvas.winfo_ismapped():
+            self._schedule_prefetch(canvas_size)
+
+    def _schedule_prefetch(self, canvas_size: Tuple[int, int]) -> None:
+        """Decode the next few images in the background.
+
+        Prefetched states are keyed by index together with the canvas size
+        they were fitted to, and dropped once they fall out of the lookahead
+        window, so Back navigation and window resizes never show stale data.
+        Images still held in the recent-history cache are not decoded again.
+        """
+
+        stop = min(self.index + 1 + PREFETCH_AHEAD, len(self.image_paths))
+        ahead = range(self.index + 1, stop)
+        for idx in list(self._prefetched):
+            if idx not in ahead or self._prefetched[idx][0] != canvas_size:
+                self._prefetched.pop(idx)[1].cancel()
+        for idx in ahead:
+            seen = self._history.get(idx)
+            if seen is not None and seen[0] == canvas_size:
+                # Already decoded when it was shown before; see load_current
+                continue
+            if idx not in self._prefetched:
+                future = self._prefetcher.submit(
+                    self._load_state, self.image_paths[idx], canvas_size
+                )
+                self._prefetched[idx] = (canvas_size, future)
+
+    def _load_state(self, path: Path, canvas_size: Tuple[int, int]) -> CropState:
+        """Load an image and build its display state without touching Tk.
+
+        Safe to call from the prefetch worker thread.
+        """
+
+        # Decode JPEGs at reduced scale for the preview only, which never
+        # exceeds the canvas; on_save re-reads the file at full resolution.
+        pil, exif = load_image_with_exif(path, target_size=canvas_size)
+        return self._build_state(path, pil, exif, canvas_size)
+
+    def _canvas_size(self) -> Tuple[int, int]:
+        canvas_w = int(self.canvas.winfo_width())
+        canvas_h = int(self.canvas.winfo_height())
+        if canvas_w <= 1 or canvas_h <= 1:
+            # Not mapped yet (Tk reports 1x1); use the requested size instead
+            canvas_w = int(self.canvas.winfo_reqwidth())
+            canvas_h = int(self.canvas.winfo_reqheight())
+        return max(1, canvas_w), max(1, canvas_h)
 
     def _build_state(
-        self, path: Path, pil: Image.Image, exif: Optional[bytes]
+        self,
+        path: Path,
+        pil: Image.Image,
+        exif: Optional[bytes],
+        canvas_size: Tuple[int, int],
     ) -> CropState:
-        # Fit display image to canvas while keeping aspect
-        canvas_w = max(1, int(self.canvas.winfo_width()) or 1024)
-        canvas_h = max(1, int(self.canvas.winfo_height()) or 768)
+        # Fit display image to canvas while keeping aspect. ``pil`` may be a
+        # draft-decoded reduction of the file; on_save re-reads the file at
+        # full resolution and maps the rect relative to the display size.
+        pil = _normalize_mode(pil)
+        canvas_w, canvas_h = canvas_size
         scale = min(canvas_w / pil.width, canvas_h / pil.height, 1.0)
         disp_w = int(round(pil.width * scale))
         disp_h = int(round(pil.height * scale))
-        display = pil.resize((disp_w, disp_h), Image.LANCZOS)
+        # Box-reduce large sources before Lanczos; the preview tolerates a
+        # tighter gap than dataset outputs.
+        display = pil.resize(
+            (disp_w, disp_h), Image.LANCZOS, reducing_gap=DISPLAY_REDUCING_GAP
+        )
+        if display.mode not in ("RGB", "RGBA"):
+            # Convert once here rather than inside every ``PhotoImage`` build
+            display = display.convert("RGB")
         return CropState(
             image_path=path,
-            pil_image=pil,
             exif_bytes=exif,
             display_image=display,
-            display_scale=scale,
-            rect=(0, 0, disp_w, disp_h),
+            rx0=0,
+            ry0=0,
+            rx1=disp_w,
+            ry1=disp_h,
             shape_label=self.shape_label,
         )
 
@@ -258,45 +398,81 @@ class ManualCropperApp:
             rect_h = int(round(rect_w / target_aspect))
         x0 = (disp_w - rect_w) // 2
         y0 = (disp_h - rect_h) // 2
-        self.current.rect = (x0, y0, x0 + rect_w, y0 + rect_h)
+        cur = self.current
+        cur.rx0, cur.ry0 = x0, y0
+        cur.rx1, cur.ry1 = x0 + rect_w, y0 + rect_h
 
     def _move_rect_to(self, x: int, y: int) -> None:
         if not self.current:
             return
-        disp_w, disp_h = self.current.display_image.size
-        x0, y0, x1, y1 = self.current.rect
-        rect_w = x1 - x0
-        rect_h = y1 - y0
+        cur = self.current
+        disp_w, disp_h = cur.display_image.size
+        rect_w = cur.rx1 - cur.rx0
+        rect_h = cur.ry1 - cur.ry0
         nx0 = max(0, min(disp_w - rect_w, x))
         ny0 = max(0, min(disp_h - rect_h, y))
-        self.current.rect = (nx0, ny0, nx0 + rect_w, ny0 + rect_h)
+        cur.rx0 = nx0
+        cur.ry0 = ny0
+        cur.rx1 = nx0 + rect_w
+        cur.ry1 = ny0 + rect_h
 
     def _redraw(self) -> None:
+        """Show the current image on the canvas.
+
+        The image, overlay and crop rectangle items are created on the first
+        load and reused afterwards: a new image only swaps the photo on the
+        image item and re-lays out the items. Drags and shape changes only
+        move the crop rectangle via ``_update_rect``.
+        """
+
         if not self.current:
             return
-        self.canvas.delete("all")
-        # Center image on canvas
-        cw = max(1, int(self.canvas.winfo_width()) or 1024)
-        ch = max(1, int(self.canvas.winfo_height()) or 768)
+        if self.current.tk_image is None:
+            self.current.tk_image = ImageTk.PhotoImage(self.current.display_image)
+        if self.image_item is None:
+            self.image_item = self.canvas.create_image(
+                0, 0, image=self.current.tk_image, anchor=tk.NW
+            )
+            # Semi-transparent overlay over the image
+            self.overlay_item = self.canvas.create_rectangle(
+                0, 0, 0, 0, fill="#000000", stipple="gray25"
+            )
+            # Red crop rectangle border
+            self.rect_item = self.canvas.create_rectangle(
+                0, 0, 0, 0, outline="red", width=2
+            )
+        else:
+            self.canvas.itemconfigure(self.image_item, image=self.current.tk_image)
+        self._layout()
+
+    def _layout(self, event: Optional[tk.Event] = None) -> None:
+        """Center the image on the canvas and reposition overlay and rect."""
+
+        if not self.current or self.image_item is None:
+            return
+        cw, ch = self._canvas_size()
         img = self.current.display_image
-        self.tk_image = ImageTk.PhotoImage(img)
         x = (cw - img.width) // 2
         y = (ch - img.height) // 2
-        self.canvas.create_image(x, y, image=self.tk_image, anchor=tk.NW)
-
+        self.image_origin = (x, y)
+        self.canvas.coords(self.image_item, x, y)
+        self.canvas.coords(self.overlay_item, x, y, x + img.width, y + img.height)
+        self._update_rect()
+        if event is not None:
+            # Mapped or resized: prefetch against the real canvas size
+            self._schedule_prefetch((cw, ch))
+
+    def _update_rect(self) -> None:
+        """Move the crop rectangle item to match the current crop rect."""
+
+        if not self.current or self.rect_item is None:
+            return
         # Offset rect by image origin
-        rx0, ry0, rx1, ry1 = self.current.rect
-        rx0 += x
-        ry0 += y
-        rx1 += x
-        ry1 += y
-        # Semi-transparent overlay outside rect
-        self.canvas.create_rectangle(
-            x, y, x + img.width, y + img.height, fill="#000000", stipple="gray25"
+        x, y = self.image_origin
+        cur = self.current
+        self.canvas.coords(
+            self.rect_item, cur.rx0 + x, cur.ry0 + y, cur.rx1 + x, cur.ry1 + y
         )
-        # Cutout area (draw as clear by overdrawing background image again)
-        # Draw red rectangle border
-        self.canvas.create_rectangle(rx0, ry0, rx1, ry1, outline="red", width=2)
 
 
 def run_manual_cropper(
@@ -7,8 +7,15 @@ constants.
 
 from __future__ import annotations
 
+import io
+import os
+import shlex
+import shutil
+import subprocess
+from concurrent.futures import Executor
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Iterable, List, Optional, Tuple
+from typing import Generator, Iterable, List, Mapping, Optional, Set, Tuple
 
 import piexif
 from PIL import Image, ImageOps
@@ -19,7 +26,20 @@ except Exception:  # noqa: BLE001
     # AVIF support is optional; environment.yml includes pillow-avif-plugin
     pass
 
-from config import IMAGE_EXTENSIONS
+from config import IMAGE_EXTENSIONS, IMAGE_EXTENSIONS_TUPLE
+
+
+# Pillow resampling constants by lowercase method name; unknown names map to
+# LANCZOS in ``map_resample``
+_RESAMPLE = {
+    "nearest": Image.NEAREST,
+    "bilinear": Image.BILINEAR,
+    "bicubic": Image.BICUBIC,
+    "lanczos": Image.LANCZOS,
+}
+
+# Alternate spellings of the same format, for matching ``postprocess`` keys
+_EXTENSION_ALIASES = {"jpeg": "jpg", "tif": "tiff"}
 
 
 def iter_image_paths(input_path: Path) -> Generator[Path, None, None]:
@@ -42,9 +62,73 @@ def iter_image_paths(input_path: Path) -> Generator[Path, None, None]:
             yield path
         return
     if path.is_dir():
-        for p in sorted(path.rglob("*")):
-            if p.is_file() and p.suffix.lower() in IMAGE_EXTENSIONS:
-                yield p
+        yield from _scan_image_paths(str(path))
+
+
+def _scan_image_paths(directory: str) -> Generator[Path, None, None]:
+    """Recursively yield image paths below ``directory`` using ``os.scandir``.
+
+    Entries are visited in name order, matching the ordering of a sorted
+    ``rglob``. The extension check is done on the raw entry name before any
+    file-type check, and only image files and subdirectories are kept for the
+    per-directory sort, so unrelated files cost one string test each. Type
+    checks reuse the cached directory entry information instead of issuing
+    extra ``stat`` calls, and ``Path`` objects are only built for yielded
+    files. Each directory handle is closed before descending, and paths
+    stream out lazily so callers can stop early. Symlinked directories are
+    not descended into.
+
+    Parameters
+    ----------
+    directory
+        Directory to scan.
+
+    Yields
+    ------
+    Path
+        Individual image file paths.
+    """
+
+    # (name, path, is_dir); names are unique within a directory, so sorting
+    # the tuples orders by name alone
+    candidates: List[Tuple[str, str, bool]] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            if name.lower().endswith(IMAGE_EXTENSIONS_TUPLE) and entry.is_file():
+                candidates.append((name, entry.path, False))
+            elif entry.is_dir(follow_symlinks=False):
+                candidates.append((name, entry.path, True))
+    candidates.sort()
+    for _, path, is_dir in candidates:
+        if is_dir:
+            yield from _scan_image_paths(path)
+        else:
+            yield Path(path)
+
+
+def existing_names(directory: Path) -> Set[str]:
+    """Return the names of all entries in a directory from a single scan.
+
+    Lets batch loops test for existing outputs with a set lookup instead of
+    one ``stat`` call per candidate.
+
+    Parameters
+    ----------
+    directory
+        Directory to list. A missing directory yields an empty set.
+
+    Returns
+    -------
+    set
+        Entry names (not full paths).
+    """
+
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except FileNotFoundError:
+        return set()
 
 
 def ensure_dir(path: Path) -> None:
@@ -59,13 +143,21 @@ def ensure_dir(path: Path) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
-def load_image_with_exif(image_path: Path) -> Tuple[Image.Image, Optional[bytes]]:
+def load_image_with_exif(
+    image_path: Path, target_size: Optional[Tuple[int, int]] = None
+) -> Tuple[Image.Image, Optional[bytes]]:
     """Load an image and return it with raw EXIF bytes if available.
 
     Parameters
     ----------
     image_path
         Path to the image file.
+    target_size
+        Optional (width, height) the caller will downscale to. For JPEGs this
+        enables libjpeg's draft mode, which decodes directly at the largest
+        1/2, 1/4 or 1/8 scale that still covers ``target_size``, and the
+        image is decoded immediately. The returned image may therefore be
+        smaller than the file on disk. Ignored for other formats.
 
     Returns
     -------
@@ -80,9 +172,80 @@ def load_image_with_exif(image_path: Path) -> Tuple[Image.Image, Optional[bytes]
             exif_bytes = img.info["exif"]
     except Exception:
         exif_bytes = None
+    # EXIF is read above, before draft() reconfigures the decoder
+    if target_size is not None and img.format == "JPEG":
+        img.draft("RGB", target_size)
+        img.load()
     return img, exif_bytes
 
 
+def read_exif_only(image_path: Path) -> Optional[bytes]:
+    """Return an image's raw EXIF bytes without decoding any pixels.
+
+    JPEGs are handled by walking the marker segments up to the first scan and
+    seeking past everything but an ``Exif`` APP1 payload, so only a few
+    hundred bytes are read when the file carries no EXIF. Other formats, and
+    JPEGs this walk cannot make sense of, fall back to Pillow's header parse.
+
+    Parameters
+    ----------
+    image_path
+        Path to the image file.
+
+    Returns
+    -------
+    bytes or None
+        EXIF bytes in the same form as ``load_image_with_exif`` (including the
+        ``Exif\\0\\0`` prefix for JPEGs), or None if the image has none.
+    """
+
+    with open(image_path, "rb") as fh:
+        if fh.read(2) == b"\xff\xd8":
+            try:
+                return _scan_jpeg_exif(fh)
+            except ValueError:
+                pass
+    with Image.open(image_path) as img:
+        return img.info.get("exif") or None
+
+
+def _scan_jpeg_exif(fh) -> Optional[bytes]:
+    """Find the first EXIF APP1 payload in a JPEG positioned after SOI.
+
+    Raises ``ValueError`` on a truncated or malformed marker sequence.
+    """
+
+    while True:
+        if fh.read(1) != b"\xff":
+            raise ValueError("expected JPEG marker")
+        marker = fh.read(1)
+        while marker == b"\xff":  # optional fill bytes
+            marker = fh.read(1)
+        if not marker:
+            raise ValueError("truncated JPEG")
+        code = marker[0]
+        if code == 0xDA or code == 0xD9:
+            # Start of scan or end of image: metadata segments are over
+            return None
+        if code == 0x01 or 0xD0 <= code <= 0xD7:
+            # Standalone markers carry no length
+            continue
+        header = fh.read(2)
+        if len(header) != 2:
+            raise ValueError("truncated JPEG")
+        length = int.from_bytes(header, "big") - 2
+        if length < 0:
+            raise ValueError("bad JPEG segment length")
+        if code == 0xE1 and length >= 6:
+            payload = fh.read(length)
+            if len(payload) != length:
+                raise ValueError("truncated JPEG")
+            if payload.startswith(b"Exif\x00\x00"):
+                return payload
+        else:
+            fh.seek(length, os.SEEK_CUR)
+
+
 def save_image(
     image: Image.Image,
     dest_path: Path,
@@ -90,6 +253,9 @@ def save_image(
     original_exif: Optional[bytes] = None,
     format_override: Optional[str] = None,
     quality: Optional[int] = None,
+    postprocess: Optional[Mapping[str, str]] = None,
+    optimize: Optional[bool] = None,
+    postprocess_executor: Optional[Executor] = None,
 ) -> None:
     """Save an image to disk, optionally preserving EXIF metadata.
 
@@ -103,29 +269,147 @@ def save_image(
         Whether to attempt preserving EXIF metadata.
     original_exif
         Original EXIF bytes captured when the image was loaded. If provided,
-        they will be used for saving when possible.
+        they will be used for saving when possible. JPEGs are encoded without
+        them and the APP1 segment is spliced in afterwards with ``piexif``.
+    format_override
+        Pillow format name to use instead of inferring it from the suffix.
+    quality
+        Encoder quality for lossy formats, overriding the per-format default.
+    postprocess
+        Optional mapping from file extension (e.g. ``"png"``; ``"jpg"`` also
+        matches ``.jpeg`` and vice versa) to a command template run on the
+        written file, such as ``"oxipng -o 4 {path}"``. Commands whose program
+        is not installed are skipped, as are failures; the file then stays as
+        Pillow wrote it.
+    optimize
+        Whether Pillow should search for the smallest PNG encoding. False
+        writes with zlib level 1 instead, which encodes several times faster
+        at roughly twice the size. If None, PNGs are optimized unless a
+        ``postprocess`` command will recompress the file anyway.
+    postprocess_executor
+        If given, the ``postprocess`` command is submitted to it instead of
+        run before returning, e.g. to keep a GUI responsive.
     """
 
     dest_path = Path(dest_path)
     ensure_dir(dest_path.parent)
 
     params = {}
-    if keep_metadata and original_exif:
-        params["exif"] = original_exif
+    exif = original_exif if keep_metadata and original_exif else None
 
     # Favor high quality when writing JPEGs
     ext = dest_path.suffix.lower()
+    command = _postprocess_command(postprocess, ext) if postprocess else None
+    post_args = _postprocess_args(command, dest_path) if command else None
+    if format_override:
+        is_jpeg = format_override.upper() in {"JPEG", "JPG"}
+    else:
+        is_jpeg = ext in {".jpg", ".jpeg"}
     if ext in {".jpg", ".jpeg"}:
         params.update({"quality": quality or 95, "subsampling": 0, "optimize": True})
     elif ext == ".png":
-        params.update({"optimize": True})
+        if optimize is None:
+            optimize = post_args is None
+        if optimize:
+            params.update({"optimize": True})
+        else:
+            params.update({"compress_level": 1})
     elif ext == ".webp":
         params.update({"quality": quality or 95})
     elif ext == ".avif":
         # pillow-avif-plugin uses quality param as well
         params.update({"quality": quality or 90})
 
-    image.save(dest_path, format=format_override, **params)
+    if is_jpeg and image.mode not in ("RGB", "L", "CMYK"):
+        # JPEG has no alpha or palette; Pillow refuses to write those modes
+        image = image.convert("RGB")
+    written = bool(exif and is_jpeg) and _save_jpeg_with_exif(
+        image, dest_path, exif, params
+    )
+    if not written:
+        if exif:
+            params["exif"] = exif
+        image.save(dest_path, format=format_override, **params)
+
+    if post_args:
+        if postprocess_executor is not None:
+            postprocess_executor.submit(_run_postprocess, post_args)
+        else:
+            _run_postprocess(post_args)
+
+
+def _save_jpeg_with_exif(
+    image: Image.Image, dest_path: Path, exif: bytes, params: dict
+) -> bool:
+    """Encode a JPEG without EXIF and insert the raw APP1 segment afterwards.
+
+    The image is encoded in memory so the file is written exactly once. Returns
+    ``False`` when ``piexif`` rejects the EXIF block, leaving the caller to fall
+    back to Pillow's own embedding.
+    """
+
+    encoded = io.BytesIO()
+    image.save(encoded, format="JPEG", **params)
+    output = io.BytesIO()
+    try:
+        piexif.insert(exif, encoded.getvalue(), output)
+    except (ValueError, piexif.InvalidImageDataError):
+        return False
+    dest_path.write_bytes(output.getvalue())
+    return True
+
+
+@lru_cache(maxsize=None)
+def _which(program: str) -> Optional[str]:
+    """Cached ``shutil.which`` so each tool is looked up once per process."""
+
+    return shutil.which(program)
+
+
+def _normalize_extension(ext: str) -> str:
+    """Lowercase an extension, drop the dot and fold alternate spellings."""
+
+    ext = ext.lower().lstrip(".")
+    return _EXTENSION_ALIASES.get(ext, ext)
+
+
+def _postprocess_command(postprocess: Mapping[str, str], ext: str) -> Optional[str]:
+    """Find the ``postprocess`` command for a file extension, if any."""
+
+    wanted = _normalize_extension(ext)
+    for key, command in postprocess.items():
+        if _normalize_extension(key) == wanted:
+            return command
+    return None
+
+
+def _postprocess_args(command: str, path: Path) -> Optional[List[str]]:
+    """Expand an optimizer command template for ``path``.
+
+    The template is split like a shell command before ``{path}`` is filled
+    in, so paths containing spaces stay a single argument. Returns None when
+    the program is not installed.
+    """
+
+    args = [arg.format(path=str(path)) for arg in shlex.split(command)]
+    if not args or _which(args[0]) is None:
+        return None
+    return args
+
+
+def _run_postprocess(args: List[str]) -> None:
+    """Run an expanded optimizer command, ignoring failures and timeouts."""
+
+    try:
+        subprocess.run(
+            args,
+            check=False,
+            timeout=30,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        pass
 
 
 def map_resample(name: str) -> int:
@@ -134,7 +418,8 @@ def map_resample(name: str) -> int:
     Parameters
     ----------
     name
-        One of 'nearest', 'bilinear', 'bicubic', 'lanczos'.
+        One of 'nearest', 'bilinear', 'bicubic', 'lanczos'. Matching is
+        case-insensitive; anything else falls back to LANCZOS.
 
     Returns
     -------
@@ -142,14 +427,7 @@ def map_resample(name: str) -> int:
         Pillow resampling constant.
     """
 
-    name_lower = (name or "").lower()
-    if name_lower == "nearest":
-        return Image.NEAREST
-    if name_lower == "bilinear":
-        return Image.BILINEAR
-    if name_lower == "bicubic":
-        return Image.BICUBIC
-    return Image.LANCZOS
+    return _RESAMPLE.get((name or "").lower(), Image.LANCZOS)
 
 
 def aspect_ratio(width: int, height: int) -> float:
@@ -7,16 +7,26 @@ with an optional prefix.
 from __future__ import annotations
 
 import os
+import uuid
 from pathlib import Path
-from typing import Iterable  # noqa: F401
+from typing import Iterable, List, Optional, Tuple  # noqa: F401
 
+from config import IMAGE_EXTENSIONS_TUPLE
 
-IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp", ".tiff")
+
+# Rename relative to an open directory descriptor where the platform allows it,
+# so the kernel does not re-resolve the directory path for every file.
+_USE_DIR_FD = os.rename in os.supports_dir_fd and os.scandir in os.supports_fd
 
 
 def rename_images(directory: Path, prefix: str = "") -> None:
     """Rename images in a directory to a sequential pattern.
 
+    Files are renamed in two phases, first to unique temporary names and then
+    to their final names, so a target name that is still held by another
+    image (e.g. ``10.png`` becoming ``2.png`` while ``2.png`` exists) never
+    overwrites it. Files already carrying their final name are left alone.
+
     Parameters
     ----------
     directory
@@ -29,13 +39,38 @@ def rename_images(directory: Path, prefix: str = "") -> None:
     if not dir_path.is_dir():
         raise FileNotFoundError(f"Directory not found: {dir_path}")
 
-    files = [
-        f for f in sorted(os.listdir(dir_path)) if f.lower().endswith(IMAGE_EXTENSIONS)
-    ]
+    dir_fd: Optional[int] = None
+    if _USE_DIR_FD:
+        dir_fd = os.open(dir_path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        with os.scandir(dir_path if dir_fd is None else dir_fd) as it:
+            files = sorted(
+                entry.name
+                for entry in it
+                if entry.name.lower().endswith(IMAGE_EXTENSIONS_TUPLE)
+                and entry.is_file()
+            )
+
+        def rename(old_name: str, new_name: str) -> None:
+            if dir_fd is None:
+                os.rename(dir_path / old_name, dir_path / new_name)
+            else:
+                os.rename(old_name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+        token = uuid.uuid4().hex
+        staged: List[Tuple[str, str]] = []
+        for index, filename in enumerate(files, start=1):
+            ext = os.path.splitext(filename)[1]
+            new_name = f"{prefix}{index}{ext}"
+            if filename == new_name:
+                # Target names are unique, so no other file will claim this one
+                continue
+            temp_name = f".{token}-{index}{ext}"
+            rename(filename, temp_name)
+            staged.append((temp_name, new_name))
 
-    for index, filename in enumerate(files, start=1):
-        ext = os.path.splitext(filename)[1]
-        new_name = f"{prefix}{index}{ext}"
-        old_path = dir_path / filename
-        new_path = dir_path / new_name
-        os.rename(old_path, new_path)
+        for temp_name, new_name in staged:
+            rename(temp_name, new_name)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
@@ -8,47 +8,132 @@ to fit within constraints.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from PIL import Image, ImageOps
 
-from config import Constraints
+from config import RESIZE_BACKEND, Constraints
 from .io_utils import map_resample
 
+if TYPE_CHECKING:
+    import numpy as np
 
-def center_crop_to_aspect(image: Image.Image, target_aspect: float) -> Image.Image:
-    """Center-crop an image to a target aspect ratio.
+try:
+    import pyvips
+except Exception:  # noqa: BLE001
+    # libvips is optional; without it everything goes through Pillow
+    pyvips = None
+
+
+# Large downscales first shrink by an integer factor with Pillow's C box
+# filter (``Image.reduce``) so that at least this much scale is left for the
+# final filter. 3.0 is visually indistinguishable from a single full resample
+# while skipping most of the kernel work on large sources.
+REDUCING_GAP = 3.0
+
+# Resolved resize backend, "vips" or "pil". Pillow-SIMD needs no dispatch as it
+# is a drop-in replacement for Pillow.
+_BACKEND = "pil" if pyvips is None or RESIZE_BACKEND == "pil" else "vips"
+
+# libvips band counts that map directly onto 8-bit Pillow modes
+_VIPS_MODES = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}
+
+
+def center_crop_box(
+    size: Tuple[int, int], target_aspect: float
+) -> Tuple[int, int, int, int]:
+    """Compute the centered box with a target aspect ratio inside ``size``.
 
     Parameters
     ----------
-    image
-        Source image.
+    size
+        Source (width, height).
     target_aspect
         Desired aspect ratio expressed as width / height.
 
     Returns
     -------
-    Image.Image
-        Cropped image with the requested aspect ratio.
+    tuple
+        Box as (left, upper, right, lower) in source pixel coordinates.
     """
 
-    width, height = image.size
+    width, height = size
     current_aspect = width / height
 
     if abs(current_aspect - target_aspect) < 1e-6:
-        return image
+        return (0, 0, width, height)
 
     if current_aspect > target_aspect:
         # Too wide: crop width
         new_width = int(round(height * target_aspect))
         x0 = (width - new_width) // 2
-        box = (x0, 0, x0 + new_width, height)
-    else:
-        # Too tall: crop height
-        new_height = int(round(width / target_aspect))
-        y0 = (height - new_height) // 2
-        box = (0, y0, width, y0 + new_height)
+        return (x0, 0, x0 + new_width, height)
+
+    # Too tall: crop height
+    new_height = int(round(width / target_aspect))
+    y0 = (height - new_height) // 2
+    return (0, y0, width, y0 + new_height)
+
 
+def center_crop_boxes(sizes: np.ndarray, target_aspect: float) -> np.ndarray:
+    """Vectorized ``center_crop_box`` for many source sizes at once.
+
+    Parameters
+    ----------
+    sizes
+        Array of shape (N, 2) holding source (width, height) pairs.
+    target_aspect
+        Desired aspect ratio expressed as width / height.
+
+    Returns
+    -------
+    np.ndarray
+        int32 array of shape (N, 4) with one (left, upper, right, lower) box
+        per row, identical to ``center_crop_box`` applied to each size.
+    """
+
+    # Imported here so CLI commands that never batch boxes skip loading numpy
+    import numpy as np
+
+    sizes = np.asarray(sizes, dtype=np.int64).reshape(-1, 2)
+    width = sizes[:, 0]
+    height = sizes[:, 1]
+    current_aspect = width / height
+
+    # np.rint rounds half to even like the builtin ``round``
+    crop_w = np.rint(height * target_aspect).astype(np.int64)
+    crop_h = np.rint(width / target_aspect).astype(np.int64)
+    keep = np.abs(current_aspect - target_aspect) < 1e-6
+    too_wide = ~keep & (current_aspect > target_aspect)
+    too_tall = ~keep & ~too_wide
+
+    new_w = np.where(too_wide, crop_w, width)
+    new_h = np.where(too_tall, crop_h, height)
+    x0 = np.where(too_wide, (width - new_w) // 2, 0)
+    y0 = np.where(too_tall, (height - new_h) // 2, 0)
+    return np.stack([x0, y0, x0 + new_w, y0 + new_h], axis=1).astype(np.int32)
+
+
+def center_crop_to_aspect(image: Image.Image, target_aspect: float) -> Image.Image:
+    """Center-crop an image to a target aspect ratio.
+
+    Parameters
+    ----------
+    image
+        Source image.
+    target_aspect
+        Desired aspect ratio expressed as width / height.
+
+    Returns
+    -------
+    Image.Image
+        Cropped image with the requested aspect ratio.
+    """
+
+    box = center_crop_box(image.size, target_aspect)
+    if box == (0, 0) + image.size:
+        return image
     return image.crop(box)
 
 
@@ -72,7 +157,99 @@ def resize_to_exact(
         Resized image.
     """
 
-    return image.resize(size, map_resample(resample))
+    return image.resize(size, map_resample(resample), reducing_gap=REDUCING_GAP)
+
+
+def crop_and_resize(
+    image: Image.Image,
+    crop_box: Tuple[float, float, float, float],
+    target_size: Tuple[int, int],
+    resample: str = "lanczos",
+) -> Image.Image:
+    """Crop a region and resize it to an exact size in a single pass.
+
+    Equivalent to ``resize_to_exact(image.crop(crop_box), target_size)`` but
+    samples straight from the source region, so no intermediate cropped image
+    is allocated.
+
+    Parameters
+    ----------
+    image
+        Source image.
+    crop_box
+        Source region as (left, upper, right, lower).
+    target_size
+        Target size (width, height).
+    resample
+        Resampling method name.
+
+    Returns
+    -------
+    Image.Image
+        Resized crop of exactly ``target_size``.
+    """
+
+    return image.resize(
+        target_size,
+        map_resample(resample),
+        box=crop_box,
+        reducing_gap=REDUCING_GAP,
+    )
+
+
+def vips_crop_to_size(
+    path: Path, target_size: Tuple[int, int], resample: str = "lanczos"
+) -> Optional[Image.Image]:
+    """Center-crop and resize an image file with libvips, if available.
+
+    ``pyvips.Image.thumbnail`` shrinks while decoding, so large JPEGs and
+    WEBPs never materialize at full resolution. Only 8-bit grey or sRGB
+    sources (with or without alpha, not palette-based) are taken, so the
+    result has the same Pillow mode as
+    ``crop_and_resize(img, center_crop_box(...), target_size)`` on the decoded
+    file; EXIF orientation is left alone just like the Pillow path.
+
+    Parameters
+    ----------
+    path
+        Source image file.
+    target_size
+        Target size (width, height).
+    resample
+        Resampling method name. libvips resamples with Lanczos only.
+
+    Returns
+    -------
+    Image.Image or None
+        Image of exactly ``target_size``, or None when the Pillow backend is
+        selected, another filter was requested, the source is not plain 8-bit
+        grey/sRGB (e.g. 16-bit, CMYK, palette or 1-bit), or libvips cannot
+        handle the file. Callers then fall back to Pillow.
+    """
+
+    if _BACKEND != "vips" or map_resample(resample) != Image.LANCZOS:
+        return None
+    target_w, target_h = target_size
+    try:
+        # ``thumbnail`` converts everything to 8-bit sRGB/grey, so inspect the
+        # source header (no pixels are decoded) to keep Pillow's output modes
+        source = pyvips.Image.new_from_file(str(path))
+        fields = source.get_fields()
+        if (
+            source.format != "uchar"
+            or source.interpretation not in ("srgb", "b-w")
+            or source.bands not in _VIPS_MODES
+            or "palette" in fields
+            or ("bits-per-sample" in fields and source.get("bits-per-sample") != 8)
+        ):
+            return None
+        vimg = pyvips.Image.thumbnail(
+            str(path), target_w, height=target_h, crop="centre", no_rotate=True
+        )
+        data = vimg.write_to_memory()
+    except pyvips.Error:
+        return None
+    return Image.frombytes(_VIPS_MODES[vimg.bands], (vimg.width, vimg.height), data)
 
 
 def resize_within_bounds(
@@ -118,7 +295,7 @@ def resize_within_bounds(
         return image
 
     new_size = (max(1, int(round(width * scale))), max(1, int(round(height * scale))))
-    return image.resize(new_size, map_resample(resample))
+    return image.resize(new_size, map_resample(resample), reducing_gap=REDUCING_GAP)
 
 
 def letterbox_to_aspect(
@@ -147,8 +324,17 @@ def letterbox_to_aspect(
     """
 
     target_w, target_h = target_size
-    img = image.copy()
-    img.thumbnail((target_w, target_h), map_resample(resample))
+    # Fit inside the target without upscaling, like ``thumbnail`` but without
+    # copying (and thus fully decoding) the source first
+    scale = min(target_w / image.width, target_h / image.height, 1.0)
+    if scale < 1.0:
+        new_size = (
+            min(target_w, max(1, int(round(image.width * scale)))),
+            min(target_h, max(1, int(round(image.height * scale)))),
+        )
+        img = image.resize(new_size, map_resample(resample), reducing_gap=REDUCING_GAP)
+    else:
+        img = image
     # Create canvas and paste centered
     canvas = Image.new("RGB", (target_w, target_h), fill)
     x = (target_w - img.width) // 2